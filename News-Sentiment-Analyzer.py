@@ -4,18 +4,103 @@
 # ---- Cell 2: Import Libraries and Download NLTK Data ----
 
 import requests                # For making HTTP requests to NewsAPI
+from requests.adapters import HTTPAdapter  # For connection pooling on the NewsAPI session
+from urllib3.util.retry import Retry       # For retrying transient NewsAPI failures
 import yfinance as yf          # To fetch historical stock price data
 import matplotlib.pyplot as plt  # For plotting data
 import pandas as pd            # For DataFrame manipulations
-import nltk                    # For natural language processing
-from nltk.sentiment.vader import SentimentIntensityAnalyzer  # VADER for sentiment analysis
-import textwrap                # For truncating/wrapping long article titles
+import numpy as np             # For numeric array operations
+import re                      # For tokenizing text in the lexicon-only sentiment mode
+import sys                     # For writing the article list in a single call
+import functools               # For wrapping the fetch functions with the disk cache
+import inspect                 # For normalizing call arguments into disk cache keys
+import hashlib                 # For building disk cache keys
+import os                      # For locating the disk cache directory
+import pickle                  # For storing cached responses on disk
+from datetime import datetime, timezone  # For the hourly cache bucket
+from concurrent.futures import ThreadPoolExecutor  # For fetching news and stock data concurrently
+import io                      # For rendering the figure to an in-memory PNG
+from IPython.display import Image, display  # For showing the rendered PNG inline
 
-# Download the VADER lexicon (only needs to be done once)
-nltk.download('vader_lexicon')
+# Parse NewsAPI responses with orjson when it is installed (much faster on large payloads);
+# otherwise use the standard library json module. Both accept the raw response bytes.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Prefer the standalone vaderSentiment package (same VADER algorithm, lexicon bundled, no heavy
+# NLTK import); fall back to NLTK's VADER if it is not installed.
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer  # VADER for sentiment analysis
+except ImportError:
+    import nltk                # For natural language processing
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer  # VADER for sentiment analysis
+    
+    # Download the VADER lexicon only if it is not already installed.
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon', quiet=True)
+
+# Load the lexicon once and reuse the analyzer across calls and notebook re-runs.
+_SIA = SentimentIntensityAnalyzer()
 
 # ---- Cell 3: Define Functions and Main Workflow ----
 
+# Reuse one HTTP session across calls so repeat runs skip the TCP/TLS handshake.
+# Transient server errors are retried with a short backoff. A 429 is not retried (NewsAPI
+# uses it for an exhausted quota), and the final response is returned rather than raised so
+# fetch_news can report its HTTP status.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      raise_on_status=False)
+))
+
+# Responses are cached on disk in hourly (UTC) buckets, so notebook re-runs within the same
+# hour skip the network entirely while fresh data is still picked up every hour.
+# The directory is project-specific so cache files never land in a shared ~/.cache root.
+CACHE_DIR = os.path.join('.cache', 'news-sentiment')
+
+
+def _disk_cache(func):
+    """
+    Caches a fetch function's result on disk, keyed by its arguments and the current UTC hour.
+    
+    Arguments are bound to the function's signature (with defaults applied), so positional and
+    keyword calls share a cache entry. Empty results (failed or empty fetches) are not cached,
+    so they are retried on the next run.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        hour_bucket = datetime.now(timezone.utc).strftime('%Y%m%d%H')
+        key = repr((func.__name__, tuple(bound.arguments.items()), hour_bucket))
+        path = os.path.join(CACHE_DIR, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.pkl')
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+        result = func(*args, **kwargs)
+        if len(result):
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(path, 'wb') as f:
+                    pickle.dump(result, f)
+            except OSError as e:
+                print(f"Warning: Could not write cache file {path}: {e}")
+        return result
+    return wrapper
+
+
+@_disk_cache
 def fetch_news(api_key, query='finance'):
     """
     Fetches news articles from NewsAPI based on the provided query.
@@ -27,20 +112,20 @@ def fetch_news(api_key, query='finance'):
     Returns:
       - A list of news articles (each as a dictionary), or an empty list if an error occurs.
     """
-    url = f'https://newsapi.org/v2/everything?q={query}&apiKey={api_key}'
+    url = 'https://newsapi.org/v2/everything'
+    params = {'q': query, 'apiKey': api_key, 'sortBy': 'publishedAt'}
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, params=params, timeout=(3.05, 10))
         if response.status_code != 200:
             print(f"Error fetching news: HTTP {response.status_code}")
             return []
-        news_data = response.json()
-        articles = news_data.get('articles', [])
-        return articles
+        return json_loads(response.content).get('articles', [])
     except Exception as e:
         print(f"Exception occurred while fetching news: {e}")
         return []
 
 
+@_disk_cache
 def fetch_stock_data(ticker, period='10d'):
     """
     Fetches historical stock price data for the specified ticker using yfinance.
@@ -50,168 +135,257 @@ def fetch_stock_data(ticker, period='10d'):
       - period: The time period to fetch data for (default is '10d' for 10 days).
     
     Returns:
-      - A pandas DataFrame with historical stock price data, or an empty DataFrame on failure.
+      - A pandas DataFrame with the daily closing price ('Close'), or an empty DataFrame on failure.
     """
     try:
         stock = yf.Ticker(ticker)
         stock_data = stock.history(period=period)
         if stock_data.empty:
             print(f"Warning: No stock data found for ticker {ticker}.")
-        return stock_data
+            return stock_data
+        return stock_data[['Close']]  # Only the closing price is used downstream.
     except Exception as e:
         print(f"Exception occurred while fetching stock data: {e}")
         return pd.DataFrame()
 
 
-def analyze_sentiment(articles):
+_TOKEN_RE = re.compile(r"[\w']+")
+
+
+def _lexicon_scores(texts, lexicon):
+    """
+    Scores texts by summing the lexicon valence of their tokens in one NumPy pass.
+    
+    Skips VADER's negation, intensifier and punctuation rules, so it is much faster on large
+    batches but less accurate. The summed valence is normalized to [-1, 1] the same way VADER
+    normalizes its compound score.
+    
+    Parameters:
+      - texts: A list of strings to score.
+      - lexicon: A dictionary mapping lowercase tokens to valence scores.
+    
+    Returns:
+      - A float64 NumPy array with one score per text.
+    """
+    tokens = [_TOKEN_RE.findall(text.lower()) for text in texts]
+    counts = np.fromiter((len(toks) for toks in tokens), dtype=np.int64, count=len(tokens))
+    valences = np.fromiter((lexicon.get(tok, 0.0) for toks in tokens for tok in toks),
+                           dtype=np.float64, count=int(counts.sum()))
+    rows = np.repeat(np.arange(len(tokens)), counts)
+    totals = np.bincount(rows, weights=valences, minlength=len(tokens))
+    return np.clip(totals / np.sqrt(totals * totals + 15), -1.0, 1.0)
+
+
+def analyze_sentiment(articles, method='vader'):
     """
     Analyzes the sentiment of each news article using VADER.
     
-    Also extracts the article's published date (if available) to allow aggregation by day.
+    Also extracts the article's published date (if available) to allow aggregation by day, and
+    formats the printable article list in the same pass over the articles.
     
     Parameters:
       - articles: A list of news articles.
+      - method: 'vader' (default) for full VADER scoring, or 'lexicon' for a faster lexicon-only
+        score that ignores negation and intensifiers.
     
     Returns:
-      - A list of dictionaries containing each article's title, its compound sentiment score, and its published date.
+      - A tuple (sentiment_scores, listings):
+          - sentiment_scores: A DataFrame with one row per article and columns 'title',
+            'sentiment' (float32 compound score) and 'date' (datetime64 publish day, NaT if unavailable).
+          - listings: A list of numbered strings with each article's title, source and publication date.
     """
-    sia = SentimentIntensityAnalyzer()
-    sentiment_scores = []
-    for article in articles:
-        title = article.get('title', '')
-        description = article.get('description', '')
-        published_at = article.get('publishedAt', None)  # ISO format string if available
-        text = f'{title} {description}' if description else title
-        sentiment = sia.polarity_scores(text)
-        sentiment_scores.append({
-            'title': title,
-            'sentiment': sentiment['compound'],
-            'date': published_at
-        })
-    return sentiment_scores
+    if method not in ('vader', 'lexicon'):
+        raise ValueError(f"Unknown sentiment method: {method!r} (expected 'vader' or 'lexicon')")
+    titles = [article.get('title', '') for article in articles]
+    descriptions = [article.get('description', '') for article in articles]
+    dates = [article.get('publishedAt', None) for article in articles]  # ISO format string if available
+    texts = [f'{title} {description}' if description else title
+             for title, description in zip(titles, descriptions)]
+    listings = [f"{idx}. {article.get('title', 'No Title Provided')} - "
+                f"Source: {article.get('source', {}).get('name', 'Unknown Source')} - "
+                f"Date: {article.get('publishedAt', 'No Date Provided')}"
+                for idx, article in enumerate(articles, 1)]
+    if method == 'lexicon':
+        compounds = _lexicon_scores(texts, _SIA.lexicon)
+    else:
+        # Scored serially: VADER and its regex tokenizer are pure Python and hold the GIL,
+        # so a thread pool would add overhead without any speedup.
+        compounds = np.fromiter((_SIA.polarity_scores(text)['compound'] for text in texts),
+                                dtype=np.float64, count=len(texts))
+    # Compound scores lie in [-1, 1], so float32 is plenty; publish times are reduced to their UTC day.
+    sentiment_scores = pd.DataFrame({
+        'title': titles,
+        'sentiment': np.asarray(compounds, dtype=np.float32),
+        'date': pd.to_datetime(dates, format='ISO8601', errors='coerce', utc=True).values.astype('datetime64[D]')
+    })
+    return sentiment_scores, listings
+
+
+def _shorten(text, width=40):
+    """
+    Truncates text to at most `width` characters, ending with '...' if it was cut.
+    """
+    return text if len(text) <= width else text[:width - 3] + '...'
 
 
 def visualize_data(stock_data, sentiment_scores, period):
     """
-    Creates three visualizations:
+    Creates up to three visualizations:
       1. Stock Price over Time.
       2. Sentiment of Top News Articles (with truncated article titles, sentiment scores, and an explanatory note).
       3. A dual-axis chart correlating daily average sentiment with the stock price.
     
+    Plots 2 and 3 are left out of the figure when there are no articles or no days where news
+    and stock prices overlap; the reason is printed instead.
+    
     Parameters:
-      - stock_data: DataFrame containing stock price data.
-      - sentiment_scores: List of dictionaries with news article titles, sentiment scores, and published dates.
+      - stock_data: DataFrame containing the daily closing price ('Close'), indexed by date.
+      - sentiment_scores: DataFrame with news article titles, sentiment scores, and published dates.
       - period: The time period examined (for display in metrics).
     """
-    # Create three subplots with custom height ratios (Plot 1 and Plot 3 are larger).
-    fig, axes = plt.subplots(3, 1, figsize=(32, 44), gridspec_kw={'height_ratios': [2, 3, 2]})
+    # Prepare the Plot 3 data up front so plots without data are left out of the figure entirely.
+    # Day keys are datetime64 (int64 under the hood) rather than Python date objects, so the
+    # groupby and merge below hash integers instead of objects. Neither needs to sort: the merge
+    # keeps the stock data's (already chronological) order.
+    df_sentiment = sentiment_scores.dropna(subset=['date'])
+    if not df_sentiment.empty:
+        daily_sentiment = df_sentiment.groupby('date', sort=False)['sentiment'].mean().reset_index()
+    else:
+        daily_sentiment = pd.DataFrame()
+    
+    if not daily_sentiment.empty:
+        # Drop the exchange timezone first so each row keeps its local trading day; `.values` on a
+        # tz-aware index would convert to UTC and shift exchanges ahead of UTC back a day.
+        stock_daily = pd.DataFrame({'date': stock_data.index.tz_localize(None).values.astype('datetime64[D]'),
+                                    'Close': stock_data['Close'].to_numpy()})
+        merged_df = pd.merge(stock_daily, daily_sentiment, on='date', how='inner',
+                             sort=False)
+    else:
+        merged_df = pd.DataFrame()
+    
+    have_sentiment = not sentiment_scores.empty
+    have_overlap = not merged_df.empty
+    if daily_sentiment.empty:
+        print("No published date information available in articles for causality analysis.")
+    elif not have_overlap:
+        print("Not enough overlapping data between news and stock prices.")
+    
+    # Create one subplot per plot with data, keeping the custom height ratios (Plot 2 is the tallest).
+    nrows = 1 + have_sentiment + have_overlap
+    height_ratios = [2] + [3] * have_sentiment + [2] * have_overlap
+    fig, axes = plt.subplots(nrows, 1, figsize=(16, 7 * nrows), dpi=100, squeeze=False,
+                             gridspec_kw={'height_ratios': height_ratios})
+    axes = axes[:, 0]
     
     # --- Plot 1: Stock Price over Time ---
     axes[0].plot(stock_data.index, stock_data['Close'], label='Stock Price', color='blue', marker='o')
-    axes[0].set_title('Stock Price over Time', fontsize=28)
-    axes[0].set_xlabel('Date', fontsize=24)
-    axes[0].set_ylabel('Price', fontsize=24)
-    axes[0].legend(fontsize=20)
-    axes[0].tick_params(axis='both', which='major', labelsize=20)
+    axes[0].set_title('Stock Price over Time', fontsize=14)
+    axes[0].set_xlabel('Date', fontsize=12)
+    axes[0].set_ylabel('Price', fontsize=12)
+    axes[0].legend(fontsize=10)
+    axes[0].tick_params(axis='both', which='major', labelsize=10)
     
     # --- Plot 2: Sentiment of Top News Articles ---
-    sorted_scores = sorted(sentiment_scores, key=lambda s: abs(s['sentiment']), reverse=True)
-    top_n = min(20, len(sorted_scores))
-    top_articles = sorted_scores[:top_n]
-    
-    sentiments = [s['sentiment'] for s in top_articles]
-    titles = [s['title'] for s in top_articles]
-    # Increase vertical spacing using a spacing factor.
-    spacing_factor = 2.0
-    y_positions = [i * spacing_factor for i in range(len(titles))]
-    
-    # Set y-axis limits to allow extra space.
-    axes[1].set_ylim(-spacing_factor * 0.5, max(y_positions) + spacing_factor * 0.5)
-    
-    # Use green for positive sentiment and red for negative sentiment.
-    colors = ['green' if s >= 0 else 'red' for s in sentiments]
-    
-    axes[1].barh(y_positions, sentiments, color=colors, align='center')
-    axes[1].set_title('Sentiment of Top 20 News Articles', fontsize=28)
-    axes[1].set_xlabel('Sentiment (Compound Score)', fontsize=24)
-    axes[1].set_xlim([-2.0, 1.1])
-    axes[1].set_yticks([])  # Remove automatic y-tick labels.
-    axes[1].tick_params(axis='both', which='major', labelsize=20)
-    
-    # Annotate each bar with the full article title (truncated if too long) and its sentiment score.
-    for y, title, sentiment in zip(y_positions, titles, sentiments):
-        truncated_title = textwrap.shorten(title, width=40, placeholder="...")
-        axes[1].text(-2.1, y, truncated_title, ha='right', va='center', fontsize=18)
-        if sentiment >= 0:
-            x_pos = sentiment + 0.05
-            ha_val = 'left'
+    if have_sentiment:
+        # Select the 20 strongest articles with a linear-time partition, then sort only those.
+        # Ties (common at a score of 0.0) are broken by original article order, both at the
+        # cutoff and in the final ordering, matching a stable descending sort of all articles.
+        all_sentiments = sentiment_scores['sentiment'].to_numpy()
+        abs_sentiments = np.abs(all_sentiments)
+        top_n = min(20, abs_sentiments.size)
+        if top_n < abs_sentiments.size:
+            cutoff = np.partition(abs_sentiments, abs_sentiments.size - top_n)[abs_sentiments.size - top_n]
+            above = np.flatnonzero(abs_sentiments > cutoff)
+            tied = np.flatnonzero(abs_sentiments == cutoff)[:top_n - above.size]
+            top_idx = np.sort(np.concatenate((above, tied)))
         else:
-            x_pos = sentiment - 0.05
-            ha_val = 'right'
-        axes[1].text(x_pos, y, f"{sentiment:.2f}", va='center', ha=ha_val, fontsize=18, color='black')
+            top_idx = np.arange(abs_sentiments.size)
+        top_idx = top_idx[np.argsort(-abs_sentiments[top_idx], kind='stable')]
+    
+        sentiments = all_sentiments[top_idx]
+        titles = sentiment_scores['title'].to_numpy()[top_idx].tolist()
+        # Increase vertical spacing using a spacing factor.
+        spacing_factor = 2.0
+        y_positions = [i * spacing_factor for i in range(len(titles))]
+    
+        # Set y-axis limits to allow extra space.
+        axes[1].set_ylim(-spacing_factor * 0.5, max(y_positions) + spacing_factor * 0.5)
     
-    # Move the explanatory note closer to the chart.
-    axes[1].text(0.5, -0.20, 
-                 "Note: Each bar represents one article's compound sentiment score (computed by VADER). "
-                 "Green indicates positive sentiment; Red indicates negative sentiment.",
-                 transform=axes[1].transAxes, fontsize=20, ha='center', va='center')
+        # Use green for positive sentiment and red for negative sentiment.
+        colors = np.where(sentiments >= 0, 'green', 'red')
+    
+        axes[1].barh(y_positions, sentiments, color=colors, align='center')
+        axes[1].set_title('Sentiment of Top 20 News Articles', fontsize=14)
+        axes[1].set_xlabel('Sentiment (Compound Score)', fontsize=12)
+        axes[1].set_xlim([-2.0, 1.1])
+        axes[1].set_yticks([])  # Remove automatic y-tick labels.
+        axes[1].tick_params(axis='both', which='major', labelsize=10)
+    
+        # Annotate each bar with the full article title (truncated if too long) and its sentiment score.
+        # Labels, positions and alignments are computed up front so the loop only draws text.
+        truncated_titles = [_shorten(title, width=40) for title in titles]
+        positive = sentiments >= 0
+        x_positions = np.where(positive, sentiments + 0.05, sentiments - 0.05)
+        alignments = np.where(positive, 'left', 'right')
+        for y, truncated_title, sentiment, x_pos, ha_val in zip(y_positions, truncated_titles, sentiments,
+                                                                x_positions, alignments):
+            axes[1].text(-2.1, y, truncated_title, ha='right', va='center', fontsize=9)
+            axes[1].text(x_pos, y, f"{sentiment:.2f}", va='center', ha=ha_val, fontsize=9, color='black')
+    
+        # Move the explanatory note closer to the chart.
+        axes[1].text(0.5, -0.20, 
+                     "Note: Each bar represents one article's compound sentiment score (computed by VADER). "
+                     "Green indicates positive sentiment; Red indicates negative sentiment.",
+                     transform=axes[1].transAxes, fontsize=10, ha='center', va='center')
     
     # --- Plot 3: Daily Average Sentiment vs Stock Price ---
-    ax3 = axes[2]
-    df_sentiment = pd.DataFrame(sentiment_scores)
-    if 'date' in df_sentiment.columns and not df_sentiment.empty:
-        df_sentiment = df_sentiment.dropna(subset=['date'])
-        df_sentiment['date'] = pd.to_datetime(df_sentiment['date']).dt.date
-        daily_sentiment = df_sentiment.groupby('date')['sentiment'].mean().reset_index()
-    else:
-        daily_sentiment = pd.DataFrame()
+    if have_overlap:
+        ax3 = axes[-1]
+        bar_colors = np.where(merged_df['sentiment'].to_numpy() >= 0, 'green', 'red')
+        ax3.bar(merged_df['date'], merged_df['sentiment'], color=bar_colors,
+                label='Daily Avg Sentiment', alpha=0.7)
+        ax3.set_ylabel('Daily Avg Sentiment', fontsize=12)
+        ax3.set_xlabel('Date', fontsize=12)
+        ax3.set_title('Daily Average Sentiment vs Stock Price', fontsize=14)
+        ax3.axhline(0, color='gray', linestyle='--', linewidth=1)
+        ax3.tick_params(axis='both', which='major', labelsize=10)
     
-    if not daily_sentiment.empty:
-        stock_data = stock_data.copy()
-        stock_data['date'] = stock_data.index.date
-        merged_df = pd.merge(stock_data.reset_index(), daily_sentiment, on='date', how='inner')
-        if not merged_df.empty:
-            bar_colors = ['green' if s >= 0 else 'red' for s in merged_df['sentiment']]
-            ax3.bar(merged_df['date'], merged_df['sentiment'], color=bar_colors,
-                    label='Daily Avg Sentiment', alpha=0.7)
-            ax3.set_ylabel('Daily Avg Sentiment', fontsize=24)
-            ax3.set_xlabel('Date', fontsize=24)
-            ax3.set_title('Daily Average Sentiment vs Stock Price', fontsize=28)
-            ax3.axhline(0, color='gray', linestyle='--', linewidth=1)
-            ax3.tick_params(axis='both', which='major', labelsize=20)
-            
-            ax3_twin = ax3.twinx()
-            ax3_twin.plot(merged_df['date'], merged_df['Close'], color='blue', marker='o', linewidth=2, label='Stock Price')
-            ax3_twin.set_ylabel('Stock Price', fontsize=24)
-            ax3_twin.tick_params(axis='both', which='major', labelsize=20)
-            
-            if len(merged_df) > 1:
-                corr = merged_df['sentiment'].corr(merged_df['Close'])
-                ax3.text(0.02, 0.95, f"Correlation: {corr:.2f}",
-                         transform=ax3.transAxes, fontsize=20,
-                         verticalalignment='top',
-                         bbox=dict(facecolor='white', alpha=0.8))
-            
-            explanation = (
-                "Explanation:\n"
-                "  • Daily Avg Sentiment Bars: Green indicates overall positive sentiment; Red indicates negative sentiment. "
-                "Values above 0 suggest positive news sentiment on that day, while values below 0 suggest negative sentiment.\n"
-                "  • Blue Line: Represents the stock's closing price.\n"
-                "  • A higher positive correlation indicates that days with more positive sentiment are generally associated with higher stock prices, "
-                "while a negative correlation suggests the opposite trend."
-            )
-            ax3.text(0.02, -0.45, explanation, transform=ax3.transAxes, fontsize=20,
-                     ha='left', va='center', wrap=True,
-                     bbox=dict(facecolor='white', edgecolor='black', alpha=0.8))
-        else:
-            ax3.text(0.5, 0.5, "Not enough overlapping data between news and stock prices.",
-                     transform=ax3.transAxes, ha='center', fontsize=24)
-    else:
-        ax3.text(0.5, 0.5, "No published date information available in articles for causality analysis.",
-                 transform=ax3.transAxes, ha='center', fontsize=24)
+        ax3_twin = ax3.twinx()
+        ax3_twin.plot(merged_df['date'], merged_df['Close'], color='blue', marker='o', linewidth=2, label='Stock Price')
+        ax3_twin.set_ylabel('Stock Price', fontsize=12)
+        ax3_twin.tick_params(axis='both', which='major', labelsize=10)
+    
+        if len(merged_df) > 1:
+            # Pearson correlation on the raw arrays; a constant series yields NaN, as in pandas.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = float(np.corrcoef(merged_df['sentiment'].to_numpy(),
+                                         merged_df['Close'].to_numpy())[0, 1])
+            ax3.text(0.02, 0.95, f"Correlation: {corr:.2f}",
+                     transform=ax3.transAxes, fontsize=10,
+                     verticalalignment='top',
+                     bbox=dict(facecolor='white', alpha=0.8))
     
-    plt.subplots_adjust(left=0.1, right=0.95, top=0.93, bottom=0.45, hspace=0.8)
-    plt.show()
+        explanation = (
+            "Explanation:\n"
+            "  • Daily Avg Sentiment Bars: Green indicates overall positive sentiment; Red indicates negative sentiment. "
+            "Values above 0 suggest positive news sentiment on that day, while values below 0 suggest negative sentiment.\n"
+            "  • Blue Line: Represents the stock's closing price.\n"
+            "  • A higher positive correlation indicates that days with more positive sentiment are generally associated with higher stock prices, "
+            "while a negative correlation suggests the opposite trend."
+        )
+        ax3.text(0.02, -0.45, explanation, transform=ax3.transAxes, fontsize=10,
+                 ha='left', va='center', wrap=True,
+                 bbox=dict(facecolor='white', edgecolor='black', alpha=0.8))
+    
+    # Leave room below Plot 3 for its explanation box when it is drawn.
+    fig.subplots_adjust(left=0.1, right=0.95, top=0.93, bottom=0.45 if have_overlap else 0.15, hspace=0.8)
+    
+    # Rasterize the figure once to PNG and display that, rather than letting the inline backend
+    # re-render it; closing the figure frees its canvas right away.
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+    plt.close(fig)
+    display(Image(data=buf.getvalue()))
 
 
 def main():
@@ -220,20 +394,26 @@ def main():
     ticker = 'AAPL'   # Change Ticker as needed for the company you want to analyze.
     period = '10d'    # Input the desired time period: eg. 10 days.
     
+    # Start both network fetches up front so the stock download overlaps with sentiment analysis.
+    executor = ThreadPoolExecutor(max_workers=2)
+    news_future = executor.submit(fetch_news, api_key, query='finance')
+    stock_future = executor.submit(fetch_stock_data, ticker, period=period)
+    executor.shutdown(wait=False)  # Submitted fetches keep running; no new work is accepted.
+    
     # Step 1: Fetch news articles related to finance.
-    articles = fetch_news(api_key, query='finance')
+    articles = news_future.result()
     if not articles:
         print("No news articles fetched. Exiting.")
         return
     
     # Step 2: Perform sentiment analysis on the fetched articles using VADER.
-    sentiment_scores = analyze_sentiment(articles)
+    sentiment_scores, listings = analyze_sentiment(articles)
     
     # Print useful metrics.
     print("=== Metrics ===")
     print("Time Period Examined:", period)
     print("Number of Articles Analyzed:", len(articles))
-    avg_sentiment = sum(s['sentiment'] for s in sentiment_scores) / len(sentiment_scores)
+    avg_sentiment = sentiment_scores['sentiment'].mean()
     print("Average Sentiment (Compound):", round(avg_sentiment, 2))
     print("Sentiment Guide: -1 = Very Negative, 0 = Neutral, 1 = Very Positive")
     print("\nRecommendation: Review the top 20 news articles in the sentiment chart to understand which news "
@@ -241,7 +421,7 @@ def main():
           "sentiment trends relate to the stock's closing price, providing insights for fundamental analysis.\n\n")
     
     # Step 3: Fetch historical stock data for the specified ticker.
-    stock_data = fetch_stock_data(ticker, period=period)
+    stock_data = stock_future.result()
     if stock_data.empty:
         print("No stock data available. Exiting.")
         return
@@ -250,12 +430,9 @@ def main():
     visualize_data(stock_data, sentiment_scores, period)
     
 # --- Additional: Print a list of all articles with full titles, their sources, and publication dates ---
+    # The listings were formatted during sentiment analysis, so the articles are not walked again.
     print("\nArticles List:")
-    for idx, article in enumerate(articles, 1):
-        title = article.get('title', 'No Title Provided')
-        source = article.get('source', {}).get('name', 'Unknown Source')
-        published_at = article.get('publishedAt', 'No Date Provided')
-        print(f"{idx}. {title} - Source: {source} - Date: {published_at}")
+    sys.stdout.write('\n'.join(listings) + '\n')
         
 # Execute the main function when running the cell
 if __name__ == "__main__":